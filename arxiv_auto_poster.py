@@ -749,15 +749,15 @@ class ArxivAutoPoster:
             # Try to crawl the full paper content (we always have the URL)
             try:
                 # Check if we have access to the crawler
-                crawler = getattr(self.bot, 'crawler', None)
-                if crawler:
+                get_crawler = getattr(self.bot, 'get_crawler', None)
+                if get_crawler:
                     from crawl4ai import CrawlerRunConfig
                     
                     # Try the HTML version first (better for parsing)
                     html_url = paper.arxiv_url.replace('/abs/', '/html/')
                     
                     logger.debug(f"Attempting to crawl ArXiv HTML: {html_url}")
-                    await crawler.start()
+                    crawler = await get_crawler()
                     result = await crawler.arun(url=html_url, config=CrawlerRunConfig(
                         exclude_external_images=False,
                         wait_for_images=True
@@ -819,6 +819,19 @@ class ArxivAutoPoster:
             logger.info(f"Using fallback comment: {fallback}")
             return fallback
 
+    def next_maintenance_time(self) -> datetime:
+        """Get when the next discovery or posting is due, for scheduling maintenance cycles."""
+        now = datetime.now(timezone.utc)
+        next_discovery = self.last_discovery + self.discovery_interval if self.last_discovery else now
+        next_posting = self.last_posting + self.posting_interval if self.last_posting else now
+        
+        # A posting that is overdue was held back (no candidates, daily limit or score
+        # threshold), so it can't happen before the next discovery refreshes candidates
+        if next_posting <= now:
+            next_posting = next_discovery
+        
+        return min(next_discovery, next_posting)
+
     def get_status(self) -> Dict[str, Any]:
         """Get current status of the auto-poster."""
         now = datetime.now(timezone.utc)
@@ -913,15 +926,15 @@ class ArxivAutoPoster:
             
             # Try to crawl the full paper content first
             try:
-                crawler = getattr(self.bot, 'crawler', None)
-                if crawler:
+                get_crawler = getattr(self.bot, 'get_crawler', None)
+                if get_crawler:
                     from crawl4ai import CrawlerRunConfig
                     
                     # Try the HTML version first (better for parsing)
                     html_url = paper.arxiv_url.replace('/abs/', '/html/')
                     
                     logger.debug(f"Attempting to crawl ArXiv HTML for accessibility assessment: {html_url}")
-                    await crawler.start()
+                    crawler = await get_crawler()
                     result = await crawler.arun(url=html_url, config=CrawlerRunConfig(
                         exclude_external_images=False,
                         wait_for_images=True
@@ -3,6 +3,7 @@ import random
 import json
 import os
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional, Dict, Any
 from pathlib import Path
@@ -14,6 +15,12 @@ from chat_logger import ChatLogger
 # Set up logger for this module
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True)
+class AutonomousResponse:
+    """A reply generated by AutonomousChat, optionally targeting a thread."""
+    text: str
+    thread_event_id: Optional[str] = None
+
 class AutonomousChat:
     """Handles autonomous conversation capabilities for the bot."""
     
@@ -416,8 +423,8 @@ class AutonomousChat:
             logger.error(f"Error checking spontaneous message: {e}")
             return None
     
-    async def handle_message(self, room, message) -> Optional[Dict[str, Any]]:
-        """Main handler for incoming messages. Returns response info if bot should respond."""
+    async def handle_message(self, room, message) -> Optional[AutonomousResponse]:
+        """Main handler for incoming messages. Returns the response if bot should respond."""
         sender = getattr(message, 'sender', 'unknown')
         content = getattr(message, 'body', '')
         room_name = getattr(room, 'display_name', None) or getattr(room, 'name', None)
@@ -459,10 +466,10 @@ class AutonomousChat:
                 thread_info = self._get_thread_info(message)
                 logger.debug(f"Debug - thread_info result: {thread_info}")
                 
-                return {
-                    'text': response_text,
-                    'thread_info': thread_info
-                }
+                return AutonomousResponse(
+                    text=response_text,
+                    thread_event_id=thread_info.get('event_id') if thread_info else None
+                )
         
         # Even if we don't respond to this message, add it to history
         if sender != self.bot_user_id:
@@ -8,10 +8,14 @@ import asyncio
 class BotCommands(niobot.Module):
     def __init__(self, bot):
         super().__init__(bot)
-        self.crawler = getattr(bot, 'crawler', None)  # type: ignore
-        # Import chat_logger here to avoid circular imports
-        from chat_logger import ChatLogger
-        self.chat_logger = ChatLogger()
+        self.get_crawler = getattr(bot, 'get_crawler', None)  # type: ignore
+        # Use the bot's shared chat logger so writes to a room file stay in order
+        # and are flushed on shutdown; fall back to a private one if none is attached
+        self.chat_logger = getattr(bot, 'chat_logger', None)  # type: ignore
+        if self.chat_logger is None:
+            # Import chat_logger here to avoid circular imports
+            from chat_logger import ChatLogger
+            self.chat_logger = ChatLogger()
     
     def get_autonomous_chat(self):
         """Get autonomous_chat instance from bot object safely."""
@@ -43,8 +47,8 @@ class BotCommands(niobot.Module):
 
     @niobot.command()
     async def read(self, ctx: niobot.Context, url: str):
-        crawler = self.crawler
-        result = await crawler.arun(url=url)  # type: ignore
+        crawler = await self.get_crawler()  # type: ignore
+        result = await crawler.arun(url=url)
         if result and hasattr(result, 'markdown'):
             article = b.ParseArticle(result.markdown)
             with open("article.txt", "w", encoding="utf-8") as f:
@@ -1,16 +1,34 @@
 import os
 import logging
+import queue
+import threading
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
+
+# Set up logger for this module
+logger = logging.getLogger(__name__)
 
 class ChatLogger:
-    """Handles logging of chat messages to separate files organized by room."""
+    """Handles logging of chat messages to separate files organized by room.
+    
+    Log calls only enqueue the entry; a background writer thread owns the
+    open files and does the actual disk I/O, so callers on the event loop
+    never block on writes. Entries arriving within BATCH_WINDOW seconds are
+    coalesced into a single write per room file.
+    """
+    
+    BATCH_WINDOW = 0.1
+    IOV_MAX = 1024  # POSIX minimum for the number of buffers in one writev()
     
     def __init__(self, log_directory: str = "chat_logs"):
         self.log_directory = Path(log_directory)
         self.log_directory.mkdir(exist_ok=True)
-        self.loggers = {}  # Cache for room-specific loggers
+        self.log_files: Dict[str, Path] = {}  # Cache for room-specific log file paths
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_loop, name="chat-log-writer", daemon=True)
+        self._writer.start()
     
     def _get_safe_room_name(self, room_id: str, room_name: Optional[str] = None) -> str:
         """Convert room ID/name to a safe filename."""
@@ -23,32 +41,84 @@ class ChatLogger:
             # Fallback to room ID only
             return room_id.replace(':', '_').replace('!', '').replace('#', '')
     
-    def _get_room_logger(self, room_id: str, room_name: Optional[str] = None) -> logging.Logger:
-        """Get or create a logger for a specific room."""
-        if room_id not in self.loggers:
+    def _get_room_log_file(self, room_id: str, room_name: Optional[str] = None) -> Path:
+        """Get or create the log file path for a specific room."""
+        if room_id not in self.log_files:
             safe_room_name = self._get_safe_room_name(room_id, room_name)
-            log_file = self.log_directory / f"{safe_room_name}.log"
-            
-            # Create logger
-            logger = logging.getLogger(f"chat.{room_id}")
-            logger.setLevel(logging.INFO)
-            
-            # Remove existing handlers to avoid duplicates
-            for handler in logger.handlers[:]:
-                logger.removeHandler(handler)
-            
-            # Create file handler
-            handler = logging.FileHandler(log_file, encoding='utf-8')
-            formatter = logging.Formatter('%(asctime)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-            
-            # Prevent propagation to root logger
-            logger.propagate = False
+            self.log_files[room_id] = self.log_directory / f"{safe_room_name}.log"
             
-            self.loggers[room_id] = logger
-            
-        return self.loggers[room_id]
+        return self.log_files[room_id]
+    
+    def _write(self, room_id: str, room_name: Optional[str], log_entry: str):
+        """Queue a log entry for the background writer."""
+        self._queue.put((self._get_room_log_file(room_id, room_name), time.time(), log_entry))
+    
+    def _write_loop(self):
+        """Writer thread: coalesce queued entries and append them to their room log files."""
+        fds: Dict[Path, int] = {}
+        try:
+            while True:
+                # Block for the first entry, then collect whatever arrives within the batch window
+                batch = [self._queue.get()]
+                time.sleep(self.BATCH_WINDOW)
+                while True:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                stop = None in batch
+                pending: Dict[Path, List[bytes]] = {}
+                for item in batch:
+                    if item is None:
+                        continue
+                    log_file, created, log_entry = item
+                    asctime = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(created))
+                    pending.setdefault(log_file, []).append(f"{asctime} - {log_entry}\n".encode('utf-8'))
+                
+                for log_file, lines in pending.items():
+                    # A bad file (name too long, disk full, permissions) only loses its own
+                    # lines; the writer thread keeps serving every other room
+                    try:
+                        fd = fds.get(log_file)
+                        if fd is None:
+                            fd = fds[log_file] = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                        self._append(fd, lines)
+                    except OSError:
+                        logger.exception(f"Failed to write {len(lines)} chat log entries to {log_file}")
+                        fd = fds.pop(log_file, None)
+                        if fd is not None:
+                            try:
+                                os.close(fd)
+                            except OSError:
+                                pass
+                
+                if stop:
+                    break
+        finally:
+            for fd in fds.values():
+                os.close(fd)
+    
+    @staticmethod
+    def _append(fd: int, lines: List[bytes]):
+        """Append lines to a file descriptor, one vectored write per chunk where available."""
+        if not hasattr(os, 'writev'):
+            data = b"".join(lines)
+            while data:
+                data = data[os.write(fd, data):]
+            return
+        for i in range(0, len(lines), ChatLogger.IOV_MAX):
+            chunk = lines[i:i + ChatLogger.IOV_MAX]
+            written = os.writev(fd, chunk)
+            remaining = b"".join(chunk)[written:]
+            while remaining:
+                remaining = remaining[os.write(fd, remaining):]
+    
+    def close(self):
+        """Flush pending entries and stop the writer thread."""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
     
     def log_message(self, room_id: str, room_name: Optional[str], sender: str, message_body: str, 
                    message_type: str = "m.text", timestamp: Optional[datetime] = None):
@@ -56,8 +126,6 @@ class ChatLogger:
         if timestamp is None:
             timestamp = datetime.now(timezone.utc)
         
-        logger = self._get_room_logger(room_id, room_name)
-        
         # Format the log entry
         if message_type == "m.text":
             log_entry = f"[{sender}] {message_body}"
@@ -76,7 +144,7 @@ class ChatLogger:
         else:
             log_entry = f"[{sender}] [{message_type}] {message_body}"
         
-        logger.info(log_entry)
+        self._write(room_id, room_name, log_entry)
     
     def log_room_event(self, room_id: str, room_name: Optional[str], event_type: str, 
                       sender: str, description: str, timestamp: Optional[datetime] = None):
@@ -84,9 +152,8 @@ class ChatLogger:
         if timestamp is None:
             timestamp = datetime.now(timezone.utc)
         
-        logger = self._get_room_logger(room_id, room_name)
         log_entry = f"[SYSTEM] {sender} {description}"
-        logger.info(log_entry)
+        self._write(room_id, room_name, log_entry)
     
     def log_bot_action(self, room_id: str, room_name: Optional[str], action: str, 
                       timestamp: Optional[datetime] = None):
@@ -94,6 +161,5 @@ class ChatLogger:
         if timestamp is None:
             timestamp = datetime.now(timezone.utc)
         
-        logger = self._get_room_logger(room_id, room_name)
         log_entry = f"[BOT] {action}"
-        logger.info(log_entry) 
\ No newline at end of file
+        self._write(room_id, room_name, log_entry) 
\ No newline at end of file
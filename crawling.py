@@ -1,18 +1,35 @@
+import asyncio
 from baml_py import Image
 from baml_client.sync_client import b
-from crawl4ai import CrawlerRunConfig
+from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig
 
 _crawler = None
+_browser_config = None
+_crawler_lock = asyncio.Lock()
 
-def set_crawler(crawler_instance):
+def configure_crawler(browser_config: BrowserConfig):
+    """Set the browser config used when the shared crawler is first created."""
+    global _browser_config
+    _browser_config = browser_config
+
+async def get_crawler():
+    """Return the shared crawler, creating and starting the browser on first use."""
     global _crawler
-    _crawler = crawler_instance
+    async with _crawler_lock:
+        if _crawler is None:
+            _crawler = AsyncWebCrawler(config=_browser_config or BrowserConfig())
+        if not getattr(_crawler, 'ready', False):
+            await _crawler.start()
+    return _crawler
+
+async def close_crawler():
+    """Shut down the shared crawler's browser if it was ever started."""
+    if _crawler is not None and getattr(_crawler, 'ready', False):
+        await _crawler.close()
 
 async def fetch_and_prepare_post_data(url):
-    if _crawler is None:
-        raise RuntimeError("Crawler has not been set. Call set_crawler() at startup.")
-    await _crawler.start()
-    result = await _crawler.arun(url=url, config=CrawlerRunConfig(
+    crawler = await get_crawler()
+    result = await crawler.arun(url=url, config=CrawlerRunConfig(
         exclude_external_images=False,
         wait_for_images=True
     ))
@@ -59,10 +76,8 @@ def fix_arxiv_image_url(paper_url: str, image_url: str) -> str:
 
 async def prepare_thread_data(url):
     """Fetch, parse, and summarize the paper, and prepare thread data for posting."""
-    if _crawler is None:
-        raise RuntimeError("Crawler has not been set. Call set_crawler() at startup.")
-    await _crawler.start()
-    result = await _crawler.arun(url=url, config=CrawlerRunConfig(
+    crawler = await get_crawler()
+    result = await crawler.arun(url=url, config=CrawlerRunConfig(
         exclude_external_images=False,
         wait_for_images=True
     ))
@@ -1,70 +1,100 @@
 import asyncio
 import logging
-import os
+import queue
+import re
 import signal
-import sys
-from pathlib import Path
+import time
+from typing import Optional
 
+import nio
 import niobot
-import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import bot_config
-from crawl4ai import AsyncWebCrawler, BrowserConfig
+from crawl4ai import BrowserConfig
 from actions import process_url
-from bot_commands import BotCommands
-from crawling import set_crawler
+from clients import post_client
+from crawling import close_crawler, configure_crawler, get_crawler
 from chat_logger import ChatLogger
 from autonomous_chat import AutonomousChat
 from arxiv_auto_poster import ArxivAutoPoster
 from datetime import datetime, timezone, timedelta
 
-# Set up log rotation - 10MB per file, keep 7 files (roughly a week of logs)
-log_handler = RotatingFileHandler(
-    'bot.log', 
-    maxBytes=10*1024*1024,  # 10MB per file
-    backupCount=7,          # Keep 7 backup files (7-14 days depending on activity)
-    encoding='utf-8'
-)
-
-logging.basicConfig(
-    level=logging.DEBUG,
-    handlers=[log_handler],
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+def configure_logging() -> QueueListener:
+    """Set up rotating, queue-backed file logging and return the started listener."""
+    # Set up log rotation - 10MB per file, keep 7 files (roughly a week of logs)
+    log_handler = RotatingFileHandler(
+        'bot.log', 
+        maxBytes=10*1024*1024,  # 10MB per file
+        backupCount=7,          # Keep 7 backup files (7-14 days depending on activity)
+        encoding='utf-8'
+    )
+    log_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    
+    # Log calls on the event loop only enqueue records; a background thread does the file I/O
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, log_handler, respect_handler_level=True)
+    
+    logging.basicConfig(
+        level=logging.DEBUG,
+        handlers=[QueueHandler(log_queue)]
+    )
+    
+    # Completely silence all nio/niobot logs. Setting the level on the top-level
+    # loggers covers every child logger, and their records are never even created.
+    for noisy_logger in ('nio', 'niobot', 'aiosqlite', 'urllib3'):
+        logging.getLogger(noisy_logger).setLevel(logging.CRITICAL)
+    
+    # Keep our bot logs at DEBUG level
+    logging.getLogger('__main__').setLevel(logging.DEBUG)
+    logging.getLogger('autonomous_chat').setLevel(logging.DEBUG)
+    logging.getLogger('bot_commands').setLevel(logging.DEBUG)
+    logging.getLogger('arxiv_auto_poster').setLevel(logging.DEBUG)
+    
+    listener.start()
+    return listener
 
-# Completely silence all nio/niobot logs
-logging.getLogger('aiosqlite').setLevel(logging.CRITICAL)
-logging.getLogger('niobot.utils.sync_store').setLevel(logging.CRITICAL)
-logging.getLogger('nio.rooms').setLevel(logging.CRITICAL)
-logging.getLogger('nio.responses').setLevel(logging.CRITICAL)
-logging.getLogger('nio.client').setLevel(logging.CRITICAL)
-logging.getLogger('nio.events').setLevel(logging.CRITICAL)
-logging.getLogger('nio.api').setLevel(logging.CRITICAL)
-logging.getLogger('nio.http').setLevel(logging.CRITICAL)
-logging.getLogger('niobot.client').setLevel(logging.CRITICAL)
-logging.getLogger('niobot.utils').setLevel(logging.CRITICAL)
-logging.getLogger('niobot.events').setLevel(logging.CRITICAL)
-logging.getLogger('nio.client.async_client').setLevel(logging.CRITICAL)
-logging.getLogger('urllib3.connectionpool').setLevel(logging.CRITICAL)
-
-# Keep our bot logs at DEBUG level
-logging.getLogger('__main__').setLevel(logging.DEBUG)
-logging.getLogger('autonomous_chat').setLevel(logging.DEBUG)
-logging.getLogger('bot_commands').setLevel(logging.DEBUG)
-logging.getLogger('arxiv_auto_poster').setLevel(logging.DEBUG)
+log_listener = configure_logging()
+log = logging.getLogger(__name__)
 
 # Initialize chat logger
 chat_logger = ChatLogger()
 
 # Store bot startup time to ignore messages from before the bot started
 BOT_STARTUP_TIME = datetime.now(timezone.utc)
+# Same instant in epoch milliseconds, for cheap comparison against server_timestamp
+BOT_STARTUP_TS_MS = int(BOT_STARTUP_TIME.timestamp() * 1000)
+
+# Maximum message age (ms) processed during initial sync, and at any time
+INITIAL_SYNC_MAX_AGE_MS = 5 * 60 * 1000
+STALE_MESSAGE_MAX_AGE_MS = 60 * 60 * 1000
+
+# First whitespace-delimited word starting with http:// or https://
+URL_RE = re.compile(r'(?<!\S)https?://\S+')
+
+# Room names for chat logging, keyed by room ID. nio computes display_name from
+# the member list on every access, so resolve it once and invalidate on changes.
+room_name_cache: dict[str, str] = {}
+
+def get_room_name(room) -> Optional[str]:
+    """Return the room's display name (or name), cached per room ID."""
+    room_id = room.room_id
+    if room_id in room_name_cache:
+        return room_name_cache[room_id]
+    room_name = getattr(room, 'display_name', None) or getattr(room, 'name', None)
+    # Don't pin a missing name, e.g. one looked up before the room's state loaded
+    if room_name:
+        room_name_cache[room_id] = room_name
+    return room_name
+
+# Bot's own user ID, bound once for the per-message sender check
+_BOT_USER_ID = bot_config.USER_ID
 
 # Flag to track if we've completed the first sync
 INITIAL_SYNC_COMPLETE = False
 
 bot = niobot.NioBot(
     homeserver=bot_config.HOMESERVER,
-    user_id=bot_config.USER_ID,
+    user_id=_BOT_USER_ID,
     device_id=bot_config.DEVICE_ID,
     store_path='./store',
     command_prefix="!",
@@ -74,15 +104,30 @@ bot = niobot.NioBot(
 )
 
 # Initialize autonomous chat
-autonomous_chat = AutonomousChat(bot_config.USER_ID, chat_logger)
+autonomous_chat = AutonomousChat(_BOT_USER_ID, chat_logger)
 
 # Store autonomous_chat on the bot for commands to access
 bot.autonomous_chat = autonomous_chat  # type: ignore
 
-browser_config = BrowserConfig()
-crawler = AsyncWebCrawler(config=browser_config)
-set_crawler(crawler)
-bot.crawler = crawler  # Attach crawler to bot for module access  # type: ignore
+# Share the chat logger so all writes go through one writer thread that shutdown() closes
+bot.chat_logger = chat_logger  # type: ignore
+
+# The crawler (and its browser) is only created when the first URL needs it
+configure_crawler(BrowserConfig())
+bot.get_crawler = get_crawler  # Attach lazy crawler accessor to bot for module access  # type: ignore
+
+# Share one pooled HTTP client for all outbound posting
+bot.post_client = post_client  # type: ignore
+
+# Strong references to long-running background tasks so they aren't garbage collected
+bot._background_tasks: set[asyncio.Task] = set()  # type: ignore
+
+def spawn(coro) -> asyncio.Task:
+    """Start a background task that is tracked until it finishes."""
+    task = asyncio.create_task(coro)
+    bot._background_tasks.add(task)  # type: ignore
+    task.add_done_callback(bot._background_tasks.discard)  # type: ignore
+    return task
 
 # Mount the bot commands module
 bot.mount_module("bot_commands")
@@ -103,36 +148,36 @@ try:
     setattr(bot, 'arxiv_auto_poster', arxiv_auto_poster)
     
     if arxiv_auto_poster.enabled:
-        logging.info("✅ ArXiv auto-poster initialized and enabled")
+        log.info("✅ ArXiv auto-poster initialized and enabled")
     else:
-        logging.info("⚠️ ArXiv auto-poster initialized but disabled (missing dependencies)")
+        log.info("⚠️ ArXiv auto-poster initialized but disabled (missing dependencies)")
         
 except ImportError as e:
-    logging.info(f"ℹ️ ArXiv auto-poster not available: {e}")
+    log.info(f"ℹ️ ArXiv auto-poster not available: {e}")
     # Set a disabled placeholder so commands can detect it's not available
     setattr(bot, 'arxiv_auto_poster', None)
 
 @bot.on_event("ready")
 async def on_ready(_):
     global INITIAL_SYNC_COMPLETE
-    logging.info("Bot is ready!")
-    logging.info(f"Log rotation: 10MB per file, keeping 7 backup files")
-    logging.info(f"Bot startup time: {BOT_STARTUP_TIME}")
-    logging.info(f"Current time: {datetime.now(timezone.utc)}")
-    logging.info(f"Ignoring messages from before: {BOT_STARTUP_TIME}")
+    log.info("Bot is ready!")
+    log.info(f"Log rotation: 10MB per file, keeping 7 backup files")
+    log.info(f"Bot startup time: {BOT_STARTUP_TIME}")
+    log.info(f"Current time: {datetime.now(timezone.utc)}")
+    log.info(f"Ignoring messages from before: {BOT_STARTUP_TIME}")
     
     # Mark that initial sync is complete
     INITIAL_SYNC_COMPLETE = True
-    logging.info("Initial sync complete - will now process new messages normally")
+    log.info("Initial sync complete - will now process new messages normally")
     
     # Start the periodic spontaneous message checker
-    asyncio.create_task(autonomous_chat.periodic_spontaneous_check(bot))
+    spawn(autonomous_chat.periodic_spontaneous_check(bot))
     
     # Start the arXiv auto-poster background task if available and enabled
     auto_poster = getattr(bot, 'arxiv_auto_poster', None)
     if auto_poster and auto_poster.enabled:
-        asyncio.create_task(arxiv_maintenance_task())
-        logging.info("🤖 ArXiv auto-poster background task started")
+        spawn(arxiv_maintenance_task())
+        log.info("🤖 ArXiv auto-poster background task started")
 
 @bot.on_event("command")
 async def on_command(ctx):
@@ -143,9 +188,9 @@ async def on_command(ctx):
     else:
         command_name = 'unknown'
     
-    logging.info("User {} ran command {}".format(ctx.message.sender, command_name))
+    log.info("User {} ran command {}".format(ctx.message.sender, command_name))
     # Log bot commands
-    room_name = getattr(ctx.room, 'display_name', None) or getattr(ctx.room, 'name', None)
+    room_name = get_room_name(ctx.room)
     chat_logger.log_bot_action(
         ctx.room.room_id, 
         room_name, 
@@ -154,11 +199,11 @@ async def on_command(ctx):
 
 @bot.on_event("command_error")
 async def on_command_error(ctx: niobot.Context, error: Exception):
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    await ctx.respond(f"[{timestamp}] An error occurred while processing your command. Please try again later.")
-    logging.error(f"[{timestamp}] Command error: {error}", exc_info=True)
+    # The log formatter already stamps records; the time here lets users match errors to the logs
+    await ctx.respond(f"[{time.strftime('%Y-%m-%d %H:%M:%S')}] An error occurred while processing your command. Please try again later.")
+    log.error("Command error: %s", error, exc_info=True)
     # Log command errors
-    room_name = getattr(ctx.room, 'display_name', None) or getattr(ctx.room, 'name', None)
+    room_name = get_room_name(ctx.room)
     command_name = getattr(getattr(ctx.message, 'command', None), 'name', 'unknown')
     chat_logger.log_bot_action(
         ctx.room.room_id, 
@@ -166,26 +211,14 @@ async def on_command_error(ctx: niobot.Context, error: Exception):
         f"Command error: !{command_name} by {ctx.message.sender} - {str(error)}"
     )
 
-@bot.on_event("message")
-async def on_message(room, message):
-    sender = getattr(message, 'sender', 'unknown')
-    body = getattr(message, 'body', str(message))
-    
-    logging.info(f"Observed message from {sender}: {body}")
-    logging.debug(f"Message details - sender: {sender}, body: {body}, type: {type(message)}")
-    
-    # Log all messages to chat logs
+def log_chat_message(room, message, sender: str, body: str, ts_ms: int, debug: bool = False):
+    """Write a Matrix message to its room's chat log."""
     message_type = getattr(message, 'msgtype', 'm.text')
-    room_name = getattr(room, 'display_name', None) or getattr(room, 'name', None)
+    room_name = get_room_name(room)
+    timestamp = datetime.fromtimestamp(ts_ms / 1000, timezone.utc)
+    if debug:
+        log.debug("Message timestamp: %s", timestamp)
     
-    # Convert server timestamp to datetime if available
-    server_timestamp = getattr(message, 'server_timestamp', None)
-    timestamp = None
-    if server_timestamp:
-        timestamp = datetime.fromtimestamp(server_timestamp / 1000, timezone.utc)
-        logging.debug(f"Message timestamp: {timestamp}")
-    
-    # Log the message
     chat_logger.log_message(
         room.room_id,
         room_name,
@@ -194,13 +227,37 @@ async def on_message(room, message):
         message_type,
         timestamp
     )
+
+@bot.on_event("message")
+async def on_message(room, message):
+    sender = getattr(message, 'sender', 'unknown')
+    # Only stringify the whole event when it has no body (getattr evaluates its default eagerly)
+    body = getattr(message, 'body', None)
+    if body is None:
+        body = str(message)
+    
+    log.info(f"Observed message from {sender}: {body}")
+    debug = log.isEnabledFor(logging.DEBUG)
+    if debug:
+        log.debug("Message details - sender: %s, body: %s, type: %s", sender, body, type(message))
+    
+    # Skip stale messages first (integer epoch-millisecond math, no datetimes) so the
+    # initial-sync backlog never reaches the chat log
+    ts_ms = getattr(message, 'server_timestamp', None) or 0
+    
+    # The bot's own messages are only logged, never processed, so skip the stale
+    # filters; the startup check still keeps old ones from the initial sync out
+    if sender == _BOT_USER_ID:
+        if ts_ms >= BOT_STARTUP_TS_MS:
+            log_chat_message(room, message, sender, body, ts_ms, debug)
+        log.debug("FILTERED: Skipping bot's own message")
+        return
     
-    # Skip processing for stale messages
-    message_time = datetime.fromtimestamp(getattr(message, 'server_timestamp', 0) / 1000, timezone.utc)
-    now = datetime.now(timezone.utc)
+    age_ms = time.time_ns() // 1_000_000 - ts_ms
     
-    logging.debug(f"Message time: {message_time}, Now: {now}, Bot startup: {BOT_STARTUP_TIME}")
-    logging.debug(f"Initial sync complete: {INITIAL_SYNC_COMPLETE}")
+    if debug:
+        log.debug("Message time (ms): %s, Age (ms): %s, Bot startup (ms): %s", ts_ms, age_ms, BOT_STARTUP_TS_MS)
+        log.debug("Initial sync complete: %s", INITIAL_SYNC_COMPLETE)
     
     # Enhanced stale message detection
     # 1. Ignore messages from before the bot started
@@ -208,84 +265,76 @@ async def on_message(room, message):
     # 3. Ignore messages older than 1 hour as a fallback
     # 4. Handle cases where server_timestamp might be missing or invalid
     
-    if not getattr(message, 'server_timestamp', None):
-        logging.debug("Message has no server timestamp; treating as potentially stale.")
+    if not ts_ms:
+        log.debug("Message has no server timestamp; treating as potentially stale.")
         return
     
     # Check if message is from before bot startup
-    if message_time < BOT_STARTUP_TIME:
-        logging.debug(f"FILTERED: Message is from before bot startup ({message_time} < {BOT_STARTUP_TIME}); ignoring as stale.")
+    if ts_ms < BOT_STARTUP_TS_MS:
+        if debug:
+            log.debug("FILTERED: Message is from before bot startup (%s < %s); ignoring as stale.", ts_ms, BOT_STARTUP_TS_MS)
         return
     
     # During initial sync, be more conservative about processing messages
     if not INITIAL_SYNC_COMPLETE:
         # During initial sync, only process very recent messages (last 5 minutes)
-        if (now - message_time).total_seconds() > 300:  # 5 minutes
-            logging.debug(f"FILTERED: During initial sync, ignoring message older than 5 minutes ({(now - message_time).total_seconds():.0f}s old)")
+        if age_ms > INITIAL_SYNC_MAX_AGE_MS:
+            if debug:
+                log.debug("FILTERED: During initial sync, ignoring message older than 5 minutes (%ss old)", age_ms // 1000)
             return
         else:
-            logging.debug(f"PROCESSING: During initial sync, processing recent message ({(now - message_time).total_seconds():.0f}s old)")
+            if debug:
+                log.debug("PROCESSING: During initial sync, processing recent message (%ss old)", age_ms // 1000)
     
     # General fallback: ignore messages older than 1 hour
-    if (now - message_time).total_seconds() > 3600:  # 1 hour fallback
-        logging.debug(f"FILTERED: Message is older than 1 hour ({(now - message_time).total_seconds():.0f}s); ignoring as stale.")
+    if age_ms > STALE_MESSAGE_MAX_AGE_MS:
+        if debug:
+            log.debug("FILTERED: Message is older than 1 hour (%ss); ignoring as stale.", age_ms // 1000)
         return
     
-    # Skip processing bot's own messages for autonomous chat
-    if sender == bot_config.USER_ID:
-        logging.debug(f"FILTERED: Skipping bot's own message")
-        return
+    # Log messages that passed the stale filter to chat logs
+    log_chat_message(room, message, sender, body, ts_ms, debug)
     
     # Check for autonomous conversation response
     try:
         autonomous_response = await autonomous_chat.handle_message(room, message)
-        if autonomous_response:
-            logging.debug(f"Debug - Autonomous response: {autonomous_response}")
-            # Handle both old string format and new dict format for backward compatibility
-            if isinstance(autonomous_response, str):
-                # Old format - just send as regular message
-                logging.debug("Debug - Sending as regular message (old format)")
-                await bot.send_message(room.room_id, autonomous_response)
-            elif isinstance(autonomous_response, dict):
-                # New format - check for threading
-                response_text = autonomous_response.get('text')
-                thread_info = autonomous_response.get('thread_info')
-                
-                logging.debug(f"Debug - Response text: {response_text}")
-                logging.debug(f"Debug - Thread info: {thread_info}")
-                
-                if response_text:
-                    if thread_info and thread_info.get('event_id'):
-                        logging.debug(f"Debug - Attempting threaded reply to {thread_info['event_id']}")
-                        # Send as threaded reply
-                        success = await autonomous_chat._send_threaded_message(
-                            bot, room.room_id, response_text, thread_info['event_id']
-                        )
-                        if not success:
-                            logging.debug("Debug - Threading failed, sending as regular message")
-                            # Fallback to regular message if threading fails
-                            await bot.send_message(room.room_id, response_text)
-                        else:
-                            logging.debug("Debug - Threaded message sent successfully")
-                    else:
-                        logging.debug("Debug - No thread info, sending as regular message")
-                        # Send as regular message
-                        await bot.send_message(room.room_id, response_text)
+        if autonomous_response is None:
+            log.debug("No autonomous response generated")
         else:
-            logging.debug("No autonomous response generated")
-    except Exception as e:
-        logging.error(f"Error in autonomous chat: {e}")
-        import traceback
-        traceback.print_exc()
+            if debug:
+                log.debug("Debug - Autonomous response: %s", autonomous_response)
+            response_text = autonomous_response.text
+            thread_event_id = autonomous_response.thread_event_id
+            if thread_event_id:
+                if debug:
+                    log.debug("Debug - Attempting threaded reply to %s", thread_event_id)
+                # Send as threaded reply
+                success = await autonomous_chat._send_threaded_message(
+                    bot, room.room_id, response_text, thread_event_id
+                )
+                if not success:
+                    log.debug("Debug - Threading failed, sending as regular message")
+                    # Fallback to regular message if threading fails
+                    await bot.send_message(room.room_id, response_text)
+                else:
+                    log.debug("Debug - Threaded message sent successfully")
+            else:
+                log.debug("Debug - No thread info, sending as regular message")
+                # Send as regular message
+                await bot.send_message(room.room_id, response_text)
+    except Exception:
+        log.exception("Error in autonomous chat")
     
     # Continue with existing URL processing logic
-    url = next((word for word in body.split() if word.startswith(("http://", "https://"))), None)
+    url_match = URL_RE.search(body)
+    url = url_match.group(0) if url_match else None
     if not url:
-        logging.debug("No URL found in message; ignoring URL processing.")
+        log.debug("No URL found in message; ignoring URL processing.")
         return
-    logging.info(f"Processing URL: {url}")
+    log.info(f"Processing URL: {url}")
     
     # Log URL processing
+    room_name = get_room_name(room)
     chat_logger.log_bot_action(
         room.room_id,
         room_name,
@@ -293,14 +342,14 @@ async def on_message(room, message):
     )
     
     try:
-        await process_url(url)
+        await process_url(url, client=bot.post_client)
         chat_logger.log_bot_action(
             room.room_id,
             room_name,
             f"Successfully processed URL: {url}"
         )
     except Exception as e:
-        logging.error(f"Exception during URL processing: {e}")
+        log.error(f"Exception during URL processing: {e}")
         chat_logger.log_bot_action(
             room.room_id,
             room_name,
@@ -315,7 +364,7 @@ async def on_room_member(room, event):
     state_key = getattr(event, 'state_key', '')
     content = getattr(event, 'content', {})
     prev_content = getattr(event, 'prev_content', {})
-    room_name = getattr(room, 'display_name', None) or getattr(room, 'name', None)
+    room_name = get_room_name(room)
     
     # Convert server timestamp if available
     server_timestamp = getattr(event, 'server_timestamp', None)
@@ -362,22 +411,61 @@ async def on_room_member(room, event):
         timestamp
     )
 
+async def on_room_name_change(room, event):
+    """Drop the cached room name when the room's name, canonical alias or members change."""
+    room_name_cache.pop(room.room_id, None)
+
+# niobot's on_event only dispatches its own string events, so register with nio directly
+bot.add_event_callback(on_room_name_change, (nio.RoomNameEvent, nio.RoomAliasEvent, nio.RoomMemberEvent))
+
+# Minimum seconds between arXiv maintenance cycles
+ARXIV_MIN_MAINTENANCE_DELAY = 5 * 60
+
 async def arxiv_maintenance_task():
     """Background task for arXiv auto-poster maintenance."""
     auto_poster = getattr(bot, 'arxiv_auto_poster', None)
     if not auto_poster or not auto_poster.enabled:
         return
         
-    logger = logging.getLogger(__name__)
-    logger.info("Starting arXiv maintenance task...")
+    log.info("Starting arXiv maintenance task...")
     
     while True:
         try:
             await auto_poster.run_maintenance_cycle()
         except Exception as e:
-            logger.error(f"Error in arXiv maintenance cycle: {e}")
+            log.error(f"Error in arXiv maintenance cycle: {e}")
         
-        # Wait 1 hour before next check (reduced frequency to respect intervals)
-        await asyncio.sleep(60 * 60)
+        # Sleep until the next discovery or posting is due, with a floor so a
+        # failing discovery isn't retried in a tight loop
+        delay = (auto_poster.next_maintenance_time() - datetime.now(timezone.utc)).total_seconds()
+        await asyncio.sleep(max(ARXIV_MIN_MAINTENANCE_DELAY, delay))
+
+async def shutdown():
+    """Release shared network resources when the bot stops."""
+    log.info("Shutting down: stopping background tasks, closing shared HTTP client and crawler")
+    background_tasks = list(bot._background_tasks)  # type: ignore
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await post_client.close()
+    chat_logger.close()
+    try:
+        await close_crawler()
+    except Exception as e:
+        log.error(f"Error closing crawler: {e}")
+
+async def main():
+    # Cancel the bot on SIGTERM so the cleanup below still runs. Windows event loops
+    # don't support signal handlers; Ctrl+C still cancels the task under asyncio.run.
+    main_task = asyncio.current_task()
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, main_task.cancel)
+    except NotImplementedError:
+        pass
+    try:
+        await bot.start(access_token=bot_config.ACCESS_TOKEN)
+    finally:
+        await shutdown()
+        log_listener.stop()
 
-bot.run(access_token=bot_config.ACCESS_TOKEN)
\ No newline at end of file
+asyncio.run(main())
@@ -1,11 +1,36 @@
-import requests
-import asyncio
-from typing import Dict
+import aiohttp
+from typing import Dict, Optional
 
 class Poster:
     def __init__(self, base_url: str, token: str):
         self.base_url = base_url
         self.token = token
+        # Shared keep-alive session, created lazily inside the running event loop
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled HTTP session, creating it on first use."""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=128, limit_per_host=32),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self.session
+
+    async def close(self) -> None:
+        """Close the pooled HTTP session if it was opened."""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
 
     def get_headers(self) -> Dict[str, str]:
         return {
@@ -17,32 +42,28 @@ class Poster:
         """Post a single post to the API. Returns True on success, False on failure."""
         url = f"{self.base_url}/api/posts"
         headers = self.get_headers()
-        def do_post():
-            return requests.post(url, headers=headers, json=post_data, allow_redirects=True)
-        resp = await asyncio.to_thread(do_post)
-        if resp.status_code in (200, 201):
-            print(f"Posted to API: {post_data.get('url')}")
-            return True
-        else:
-            print(f"Failed to post to API: {resp.status_code} {resp.text}")
-            print(f"Request URL: {url}")
-            print(f"Request Headers: {headers}")
-            print(f"Request Payload: {post_data}")
-            return False
+        async with self._get_session().post(url, headers=headers, json=post_data, allow_redirects=True) as resp:
+            if resp.status in (200, 201):
+                print(f"Posted to API: {post_data.get('url')}")
+                return True
+            else:
+                print(f"Failed to post to API: {resp.status} {await resp.text()}")
+                print(f"Request URL: {url}")
+                print(f"Request Headers: {headers}")
+                print(f"Request Payload: {post_data}")
+                return False
 
     async def post_thread(self, thread_data: dict) -> bool:
         """Post a thread to the API. Returns True on success, False on failure."""
         url = f"{self.base_url}/api/threads"
         headers = self.get_headers()
-        def do_post():
-            return requests.post(url, headers=headers, json=thread_data, allow_redirects=True)
-        resp = await asyncio.to_thread(do_post)
-        if resp.status_code in (200, 201):
-            print(f"Posted thread to API: {thread_data.get('thread_title')}")
-            return True
-        else:
-            print(f"Failed to post thread to API: {resp.status_code} {resp.text}")
-            print(f"Request URL: {url}")
-            print(f"Request Headers: {headers}")
-            print(f"Request Payload: {thread_data}")
-            return False 
\ No newline at end of file
+        async with self._get_session().post(url, headers=headers, json=thread_data, allow_redirects=True) as resp:
+            if resp.status in (200, 201):
+                print(f"Posted thread to API: {thread_data.get('thread_title')}")
+                return True
+            else:
+                print(f"Failed to post thread to API: {resp.status} {await resp.text()}")
+                print(f"Request URL: {url}")
+                print(f"Request Headers: {headers}")
+                print(f"Request Payload: {thread_data}")
+                return False